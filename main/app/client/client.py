@@ -17,7 +17,7 @@ Detailed explanations:
 import asyncio                        # For asynchronous operations
 import os                             # To access environment variables and file paths
 import sys                            # For system-specific parameters and error handling
-import json                           # For reading and writing JSON data
+import orjson                         # For fast parsing of JSON data
 from contextlib import AsyncExitStack # For managing multiple asynchronous context managers
 
 from mcp import ClientSession, StdioServerParameters  # For managing MCP client sessions and server parameters
@@ -26,25 +26,27 @@ from mcp.client.stdio import stdio_client             # For establishing a stdio
 from langchain_mcp_adapters.tools import load_mcp_tools  # Adapter to convert MCP tools to LangChain compatible tools
 from langgraph.prebuilt import create_react_agent        # Function to create a prebuilt React agent using LangGraph
 from langchain_google_genai import ChatGoogleGenerativeAI  # Wrapper for the Google Gemini API via LangChain
-from langchain_core.messages import HumanMessage, AIMessage
+from langchain_core.messages import HumanMessage, AIMessage, SystemMessage, ToolMessage
 
 
 from dotenv import load_dotenv
 load_dotenv()  # Load environment variables from a .env file (e.g., GOOGLE_API_KEY)
 
-class CustomEncoder(json.JSONEncoder):
+_MESSAGE_TYPES = (HumanMessage, AIMessage, SystemMessage, ToolMessage)
+
+def message_default(o):
     """
-    Custom JSON encoder to handle non-serializable objects returned by LangChain.
-    If the object has a 'content' attribute (such as HumanMessage or ToolMessage), serialize it accordingly.
+    orjson `default=` hook for the non-serializable message objects returned by LangChain.
+    Messages (HumanMessage, AIMessage, ToolMessage, ...) are serialized as their type and content.
     """
-    def default(self, o):
-        # Check if the object has a 'content' attribute
-        if hasattr(o, "content"):
-            # Return a dictionary containing the type and content of the object
-            return {"type": o.__class__.__name__, "content": o.content}
-        # Otherwise, use the default serialization
-        return super().default(o)
+    # Dispatch on the exact type rather than probing attributes
+    if type(o) in _MESSAGE_TYPES:
+        return {"type": type(o).__name__, "content": o.content}
+    raise TypeError(f"Type is not JSON serializable: {type(o).__name__}")
+
 
+# Parsed configs keyed by (path, mtime), so re-initializing skips the parse
+_CONFIG_CACHE: dict[tuple[str, float], dict] = {}
 
 def read_config_json():
     """
@@ -67,9 +69,13 @@ def read_config_json():
         print(f"config not set. Falling back to: {config_path}")
 
     try:
-        # Open and read the JSON config file
-        with open(config_path, "r") as f:
-            return json.load(f)
+        # Reuse the parsed config unless the file changed since it was last read
+        key = (config_path, os.path.getmtime(config_path))
+        if key not in _CONFIG_CACHE:
+            # Open and read the JSON config file in one go
+            with open(config_path, "rb") as f:
+                _CONFIG_CACHE[key] = orjson.loads(f.read())
+        return _CONFIG_CACHE[key]
     except Exception as e:
         # If reading fails, print an error and exit the program
         print(f" Failed to read config file at '{config_path}': {e}")
@@ -83,11 +89,21 @@ llm = ChatGoogleGenerativeAI(
     google_api_key=os.getenv("GOOGLE_API_KEY")  # Retrieve the Google API key from environment variables
 )
 
+# Number of most recent chat messages sent to the agent verbatim. Once the history grows
+# HISTORY_SLACK messages past this, the older ones are folded into a single summary.
+HISTORY_WINDOW = 12
+HISTORY_SLACK = 4
+SUMMARY_PROMPT = (
+    "Summarize the following dialogue in <=200 tokens, preserving user preferences "
+    "and pending tasks."
+)
+
 class MCPAgentWrapper:
     def __init__(self):
         self.stack = AsyncExitStack()
         self.agent = None
-        self.chat_history = []  # Stores HumanMessage and AIMessage objects
+        self.chat_history = []  # Stores HumanMessage and AIMessage objects, optionally led by a summary SystemMessage
+        self._compact_lock = asyncio.Lock()  # Only one summarization at a time
 
     async def initialize(self):
         config = read_config_json()
@@ -98,6 +114,11 @@ class MCPAgentWrapper:
         await self.stack.__aenter__()
         tools = []
 
+        # Spawning the server processes and entering their contexts is cheap, so do it
+        # sequentially on this task (the anyio scopes must be exited from the task that
+        # entered them). The slow part, the MCP handshake and tool listing, runs
+        # concurrently below.
+        sessions = {}
         for server_name, server_info in mcp_servers.items():
             try:
                 print(f"\nConnecting to MCP Server: {server_name}...")
@@ -106,45 +127,135 @@ class MCPAgentWrapper:
                     args=server_info["args"]
                 )
                 read, write = await self.stack.enter_async_context(stdio_client(server_params))
-                session = await self.stack.enter_async_context(ClientSession(read, write))
-                await session.initialize()
-                server_tools = await load_mcp_tools(session)
-                for tool in server_tools:
-                    print(f"  Loaded tool: {tool.name}")
-                tools.extend(server_tools)
-                print(f"✔ {len(server_tools)} tools loaded from {server_name}.")
+                sessions[server_name] = await self.stack.enter_async_context(ClientSession(read, write))
             except Exception as e:
                 print(f"✘ Failed to connect to server {server_name}: {e}")
 
+        results = await asyncio.gather(
+            *(self._load_session_tools(session) for session in sessions.values()),
+            return_exceptions=True
+        )
+        for server_name, result in zip(sessions, results):
+            if isinstance(result, BaseException):
+                print(f"✘ Failed to connect to server {server_name}: {result}")
+                continue
+            tools.extend(result)
+            print(f"✔ {len(result)} tools loaded from {server_name}.")
+
         if not tools:
             raise RuntimeError("No tools loaded from any server.")
 
         self.agent = create_react_agent(llm, tools)
         print("Agent initialized with tools.")
 
+    async def _load_session_tools(self, session):
+        """
+        Performs the MCP handshake on an opened session and loads its tools.
+        """
+        await session.initialize()
+        server_tools = await load_mcp_tools(session)
+        for tool in server_tools:
+            print(f"  Loaded tool: {tool.name}")
+        return server_tools
+
+    async def _compact_history(self):
+        """
+        Replaces everything but the last HISTORY_WINDOW messages with an LLM summary,
+        so the prompt sent on each turn stays bounded instead of growing with the chat.
+        If summarizing fails the history is left as is, so the turn still goes through.
+        """
+        # Skip if another request is already compacting; its summary covers this prefix too
+        if len(self.chat_history) <= HISTORY_WINDOW + HISTORY_SLACK or self._compact_lock.locked():
+            return
+
+        async with self._compact_lock:
+            # Keep the tail starting on a user turn so the agent never sees a dangling reply
+            cut = len(self.chat_history) - HISTORY_WINDOW
+            while cut < len(self.chat_history) and not isinstance(self.chat_history[cut], HumanMessage):
+                cut += 1
+
+            transcript = []
+            for msg in self.chat_history[:cut]:
+                if isinstance(msg, SystemMessage):
+                    transcript.append(f"Earlier summary: {msg.content}")
+                elif isinstance(msg, HumanMessage):
+                    transcript.append(f"User: {msg.content}")
+                else:
+                    transcript.append(f"Assistant: {msg.content}")
+
+            try:
+                summary = await llm.ainvoke([
+                    SystemMessage(content=SUMMARY_PROMPT),
+                    HumanMessage(content="\n".join(transcript)),
+                ])
+            except Exception as e:
+                # Summarizing only saves tokens; send the full history this turn and retry on the next
+                print(f"✘ Failed to summarize chat history: {e}")
+                return
+
+            # Replace the prefix in place: other requests may have appended to the history
+            # while the summary was being generated, and those messages must be kept
+            self.chat_history[:cut] = [
+                SystemMessage(content=f"Summary of the conversation so far: {summary.content}"),
+            ]
+
     async def invoke(self, user_input: str):
         """
         Adds the user query to the history, sends it to the agent,
-        appends the response to history, and returns the response.
+        appends the response to history, and returns the response
+        together with its last non-empty AIMessage (or None).
         """
         if not self.agent:
             raise RuntimeError("Agent not initialized. Call initialize() first.")
         print("Hi", user_input)
         # Add user input to history
         self.chat_history.append(HumanMessage(content=user_input))
+        await self._compact_history()
 
-        # Invoke with full message history
+        # Invoke with the (summarized) message history
         response = await self.agent.ainvoke({"messages": self.chat_history})
 
-        # Append latest AI response to history
-        ai_messages = [
-            msg for msg in response.get("messages", [])
-            if isinstance(msg, AIMessage) and msg.content.strip()
-        ]
-        if ai_messages:
-            self.chat_history.append(ai_messages[-1])
+        # Append latest AI response to history; it is almost always at the tail
+        last_ai = None
+        for msg in reversed(response.get("messages", [])):
+            if isinstance(msg, AIMessage) and msg.content.strip():
+                last_ai = msg
+                break
+        if last_ai:
+            self.chat_history.append(last_ai)
+
+        return response, last_ai
+
+    async def astream(self, user_input: str):
+        """
+        Same as invoke, but streams the agent's reply while it is generated.
+        Yields {"delta": text} events, and {"reset": True} when a new model call in the
+        ReAct loop (e.g. after a tool result) supersedes the text streamed so far.
+        Only the final reply is appended to history once the stream ends.
+        """
+        if not self.agent:
+            raise RuntimeError("Agent not initialized. Call initialize() first.")
+        self.chat_history.append(HumanMessage(content=user_input))
+        await self._compact_history()
+
+        parts = []
+        async for event in self.agent.astream_events({"messages": self.chat_history}, version="v2"):
+            if event["event"] == "on_chat_model_start":
+                if parts:
+                    parts = []
+                    yield {"reset": True}
+                continue
+            if event["event"] != "on_chat_model_stream":
+                continue
+            delta = event["data"]["chunk"].content
+            if not isinstance(delta, str) or not delta:
+                continue
+            parts.append(delta)
+            yield {"delta": delta}
 
-        return response
+        reply = "".join(parts)
+        if reply.strip():
+            self.chat_history.append(AIMessage(content=reply))
 
     async def run_agent(self):
         """
@@ -159,11 +270,7 @@ class MCPAgentWrapper:
             if query.lower() == "quit":
                 break
             try:
-                response = await self.invoke(query)
-                ai_messages = [
-                    msg.content for msg in response["messages"]
-                    if isinstance(msg, AIMessage) and msg.content.strip()
-                ]
-                print(f"\n{ai_messages[-1] if ai_messages else '⚠️ No AIMessage found.'}")
+                _, last_ai = await self.invoke(query)
+                print(f"\n{last_ai.content if last_ai else '⚠️ No AIMessage found.'}")
             except Exception as e:
                 print(f" Error: {e}")
@@ -1,19 +1,23 @@
 from mcp.server.fastmcp import FastMCP
-import smtplib
+import asyncio
+import aiosmtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import datetime
 import os
 import pickle
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from google.auth.transport.requests import Request
 from dateutil import parser
 from twilio.rest import Client
-from pydantic import BaseModel, field_validator,ValidationError
-from typing import List, Union
-import requests
-import pytz
+from pydantic import BaseModel, TypeAdapter, field_validator,ValidationError
+from typing import List, Optional, Union
+import httpx
+from zoneinfo import ZoneInfo
 
 from dotenv import load_dotenv
 
@@ -25,8 +29,57 @@ SCOPES = ['https://www.googleapis.com/auth/calendar.events']
 # Initialize FastMCP server with the name "mytools"
 mcp = FastMCP("assistant")
 
+# Bounded pool for the blocking SDK calls (Calendar, Twilio) made by tools; size it here.
+IO_EXECUTOR = ThreadPoolExecutor(max_workers=32, thread_name_prefix="mcp-io")
+
+
+async def _run_blocking(fn, *args):
+    return await asyncio.get_running_loop().run_in_executor(IO_EXECUTOR, fn, *args)
+
+
+# Shared async HTTP client so tool calls reuse pooled connections. Idle connections are
+# kept for a minute (httpx defaults to 5s) since tool calls arrive seconds to minutes apart.
+_HTTP = httpx.AsyncClient(
+    timeout=15.0,
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=40, keepalive_expiry=60.0),
+)
+
+# Authenticated SMTP session reused across send_email calls.
+_SMTP: Optional[aiosmtplib.SMTP] = None
+_SMTP_PASSWORD: Optional[str] = None
+_SMTP_LOCK = asyncio.Lock()
+
+
+async def _get_smtp(sender_email, sender_password, stale=None):
+    """
+    Returns the cached, authenticated SMTP session, (re)connecting if needed.
+    Pass the session that just failed as `stale` to have it discarded; a session
+    another call has already rebuilt in the meantime is left alone.
+    """
+    global _SMTP, _SMTP_PASSWORD
+    async with _SMTP_LOCK:
+        if stale is not None and _SMTP is stale:
+            _SMTP.close()
+            _SMTP, _SMTP_PASSWORD = None, None
+        if _SMTP is None or not _SMTP.is_connected or _SMTP_PASSWORD != sender_password:
+            if _SMTP is not None and _SMTP.is_connected:
+                _SMTP.close()
+            _SMTP, _SMTP_PASSWORD = None, None
+            # Connect to Gmail SMTP server and secure the connection; only cache it once logged in
+            smtp = aiosmtplib.SMTP(hostname='smtp.gmail.com', port=587, start_tls=True)
+            try:
+                await smtp.connect()
+                await smtp.login(sender_email, sender_password)
+            except Exception:
+                if smtp.is_connected:
+                    smtp.close()
+                raise
+            _SMTP, _SMTP_PASSWORD = smtp, sender_password
+        return _SMTP
+
+
 @mcp.tool()
-def send_email( sender_password, recipient_email, subject, message):
+async def send_email( sender_password, recipient_email, subject, message):
     """
     It sends emails to the neede person. 
     
@@ -53,22 +106,24 @@ def send_email( sender_password, recipient_email, subject, message):
         # Attach the message body
         msg.attach(MIMEText(message, 'plain'))
 
-        # Connect to Gmail SMTP server
-        server = smtplib.SMTP('smtp.gmail.com', 587)
-        server.starttls()  # Secure the connection
-        server.login(sender_email, sender_password)
-
-        # Send the email
-        server.send_message(msg)
+        # Send the email, reconnecting once if the server dropped the idle session
+        server = None
+        try:
+            server = await _get_smtp(sender_email, sender_password)
+            await server.send_message(msg)
+        except aiosmtplib.SMTPServerDisconnected:
+            server = await _get_smtp(sender_email, sender_password, stale=server)
+            await server.send_message(msg)
         print("Email sent successfully.")
 
-        # Close the connection
-        server.quit()
-
     except Exception as e:
         print(f"Failed to send email: {e}")
 
 
+# Splits "a@x.com, b@y.com and c@z.com" style attendee lists
+_EMAIL_SPLIT = re.compile(r"\s*,\s*|\s+and\s+")
+
+
 class ScheduleMeetingInput(BaseModel):
     summary: str
     description: str
@@ -80,17 +135,20 @@ class ScheduleMeetingInput(BaseModel):
     @classmethod
     def parse_emails(cls, v):
         if isinstance(v, str):
-            return [email.strip() for email in v.replace(" and ", ",").split(",")]
+            return [email.strip() for email in _EMAIL_SPLIT.split(v) if email.strip()]
         return v
 
+# Built once so each call goes straight to the compiled core validator
+_SCHEDULE_MEETING_ADAPTER = TypeAdapter(ScheduleMeetingInput)
+
 @mcp.tool()
-def schedule_meeting_input_parser(input: dict):
+async def schedule_meeting_input_parser(input: dict):
     """
     Wrapper for schedule_meeting using manual schema parsing from dict.
     """
     try:
-        parsed = ScheduleMeetingInput(**input)
-        return schedule_meeting(
+        parsed = _SCHEDULE_MEETING_ADAPTER.validate_python(input)
+        return await schedule_meeting(
             summary=parsed.summary,
             description=parsed.description,
             start_time=parsed.start_time,
@@ -101,9 +159,21 @@ def schedule_meeting_input_parser(input: dict):
         return f"❌ Input validation failed: {e}"
 
 
+# Default time zone for meetings, shared by every schedule_meeting call.
+_KARACHI = ZoneInfo("Asia/Karachi")
+
+# Cached across tool calls so token.pickle and the Calendar discovery document are
+# only loaded once per server process.
+_CREDS = None
+_CAL_SERVICE = None
+# The Calendar client's httplib2 transport is not thread-safe; tool calls run in worker threads.
+_CAL_LOCK = threading.Lock()
+
+
 def authenticate_google():
-    creds = None
-    if os.path.exists('token.pickle'):
+    global _CREDS
+    creds = _CREDS
+    if creds is None and os.path.exists('token.pickle'):
         with open('token.pickle', 'rb') as token:
             creds = pickle.load(token)
 
@@ -118,10 +188,18 @@ def authenticate_google():
         with open('token.pickle', 'wb') as token:
             pickle.dump(creds, token)
 
+    _CREDS = creds
     return creds
 
+
+def _get_calendar_service():
+    global _CAL_SERVICE
+    if _CAL_SERVICE is None:
+        _CAL_SERVICE = build('calendar', 'v3', credentials=authenticate_google(), cache_discovery=False)
+    return _CAL_SERVICE
+
 @mcp.tool()
-def schedule_meeting(summary, description, start_time, duration_minutes, attendees_emails):
+async def schedule_meeting(summary, description, start_time, duration_minutes, attendees_emails):
     """
     Schedules a Google Calendar event with Google Meet conferencing.
 
@@ -145,18 +223,26 @@ def schedule_meeting(summary, description, start_time, duration_minutes, attende
         - The user's Gmail account must have Google Calendar enabled.
         - Time zone is set to 'Asia/Karachi' by default; modify as needed.
     """
-    creds = authenticate_google()
-    service = build('calendar', 'v3', credentials=creds)
+    return await _run_blocking(
+        _schedule_meeting, summary, description, start_time, duration_minutes, attendees_emails
+    )
+
+
+def _schedule_meeting(summary, description, start_time, duration_minutes, attendees_emails):
+    with _CAL_LOCK:
+        service = _get_calendar_service()
     if isinstance(attendees_emails, str):
-        attendees_emails = [email.strip() for email in attendees_emails.split(",")]
+        attendees_emails = [email.strip() for email in _EMAIL_SPLIT.split(attendees_emails) if email.strip()]
     if isinstance(start_time, str):
         try:
-            # Parse the time and attach timezone only if naive
-            start_time = parser.parse(start_time)
-            if start_time.tzinfo is None or start_time.tzinfo.utcoffset(start_time) is None:
-                start_time = start_time.replace(tzinfo=pytz.timezone("Asia/Karachi"))
-            # Force conversion to avoid offset errors
-            start_time = start_time.astimezone(pytz.UTC).astimezone(pytz.timezone("Asia/Karachi"))
+            # ISO strings take the fast stdlib path; anything else falls back to dateutil
+            try:
+                start_time = datetime.datetime.fromisoformat(start_time)
+            except ValueError:
+                start_time = parser.parse(start_time)
+            # Attach the default timezone only if naive; aware times keep their offset
+            if start_time.tzinfo is None:
+                start_time = start_time.replace(tzinfo=_KARACHI)
         except Exception as e:
             error_msg = f"Failed to schedule meeting: {e}"
             print(error_msg)
@@ -189,19 +275,20 @@ def schedule_meeting(summary, description, start_time, duration_minutes, attende
             },
         }
 
-        created_event = service.events().insert(
-            calendarId='primary',
-            body=event,
-            conferenceDataVersion=1,
-            sendUpdates='all'
-        ).execute()
+        with _CAL_LOCK:
+            created_event = service.events().insert(
+                calendarId='primary',
+                body=event,
+                conferenceDataVersion=1,
+                sendUpdates='all'
+            ).execute()
         print(created_event['hangoutLink'])
 
     except Exception as e:
         return f"Failed to schedule meeting: {e}"
 
 @mcp.tool()
-def send_message_via_whatsapp(body,to):
+async def send_message_via_whatsapp(body,to):
     """
     Sends a WhatsApp message using the Twilio API.
 
@@ -217,6 +304,10 @@ def send_message_via_whatsapp(body,to):
     Returns:
         None: Prints the message body upon successful send.
     """
+    return await _run_blocking(_send_message_via_whatsapp, body, to)
+
+
+def _send_message_via_whatsapp(body, to):
     account_sid = os.getenv("account_sid")
     auth_token = os.getenv("auth_token")
     from_ = os.getenv("from_")
@@ -232,7 +323,7 @@ def send_message_via_whatsapp(body,to):
 
 
 @mcp.tool()
-def send_message_on_slack(channel: str, message: str):
+async def send_message_on_slack(channel: str, message: str):
     """
     Sends a message to a Slack channel using Slack Bot Token.
 
@@ -252,7 +343,7 @@ def send_message_on_slack(channel: str, message: str):
     headers = {"Authorization": f"Bearer {slack_token}"}
     payload = {"channel": channel, "text": message}
 
-    response = requests.post(url, headers=headers, json=payload)
+    response = await _HTTP.post(url, headers=headers, json=payload)
 
     if response.status_code == 200:
         data = response.json()
@@ -74,25 +74,44 @@ async function sendToServer(message) {
       throw new Error(`HTTP ${response.status}`);
     }
     
-    const data = await response.json();
-    console.log("Server response:", data);
-    
-    // Display bot response
+    // Bot message is filled in as the server streams "data: {...}" events
     const botMsg = document.createElement("div");
     botMsg.className = "bot-message message";
+    document.getElementById("chatMessages").appendChild(botMsg);
     
-    if (data.error) {
-      botMsg.textContent = `Error: ${data.error}`;
-      botMsg.classList.add("error-message");
-    } else if (data.response) {
-      botMsg.textContent = data.response;
-    } else {
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = "";
+    
+    while (true) {
+      const { value, done } = await reader.read();
+      if (done) break;
+      buffer += decoder.decode(value, { stream: true });
+      
+      const events = buffer.split("\n\n");
+      buffer = events.pop();
+      
+      for (const event of events) {
+        if (!event.startsWith("data: ")) continue;
+        const data = JSON.parse(event.slice(6));
+        
+        if (data.error) {
+          botMsg.textContent = `Error: ${data.error}`;
+          botMsg.classList.add("error-message");
+        } else if (data.reset) {
+          // A later model call replaces the text streamed so far
+          botMsg.textContent = "";
+        } else if (data.delta) {
+          botMsg.textContent += data.delta;
+        }
+      }
+    }
+    
+    if (!botMsg.textContent) {
       botMsg.textContent = "No response from server";
       botMsg.classList.add("error-message");
     }
     
-    document.getElementById("chatMessages").appendChild(botMsg);
-    
   } catch (error) {
     console.error("Error:", error);
     
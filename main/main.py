@@ -1,11 +1,12 @@
+import orjson
 import uvicorn
 from fastapi import FastAPI,Request
 from pydantic import BaseModel
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
-from app.client.client import MCPAgentWrapper
+from app.client.client import MCPAgentWrapper, message_default
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -24,6 +25,9 @@ mcp_wrapper = MCPAgentWrapper()
 async def startup_event():
     await mcp_wrapper.initialize()
 
+def sse_event(payload):
+    return b"data: " + orjson.dumps(payload, default=message_default) + b"\n\n"
+
 class QueryInput(BaseModel):
     message: str
 
@@ -32,32 +36,23 @@ async def chat(request: Request):
     data = await request.json()
     message = data.get("message", "")
     message=f"You are omnibot a personal assistant built by waleed abbas. Now cater this query: {message}"
-    try:
-        response = await mcp_wrapper.invoke(message)
-        
-        if hasattr(response, 'get'):
-            ai_messages = [
-                msg for msg in response.get("messages", [])
-                if hasattr(msg, "content") and getattr(msg, "content", "").strip()
-            ]
-        else:
-            print(f"Response is not a dict-like object: {response}")
-            return {"response": "Invalid response format from MCP wrapper"}
-
-        print(f"AI messages found: {len(ai_messages)}")
-        for i, msg in enumerate(ai_messages):
-            print(f"Message {i}: {msg.content[:100]}")
-
-        if not ai_messages:
-            return {"response": "No AIMessage returned. Try rephrasing your request."}
 
-        return {"response": ai_messages[-1].content}
+    async def event_stream():
+        # Tracks whether the final model reply (text after the last reset) had any content
+        received = False
+        try:
+            async for event in mcp_wrapper.astream(message):
+                received = "delta" in event
+                yield sse_event(event)
+            if not received:
+                yield sse_event({"delta": "No AIMessage returned. Try rephrasing your request."})
+        except Exception as e:
+            import traceback
+            print(f"Error in chat endpoint: {e}")
+            traceback.print_exc()
+            yield sse_event({"error": str(e)})
 
-    except Exception as e:
-        import traceback
-        print(f"Error in chat endpoint: {e}")
-        traceback.print_exc()
-        return {"error": str(e)}
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
 
 
 @app.get("/")
@@ -65,4 +60,8 @@ async def index():
     return FileResponse("app/templates/index.html")
 
 if __name__ == "__main__":
-    uvicorn.run("main:app", host="127.0.0.1", port=8000, reload=True)
+    # loop="auto" picks uvloop when it is installed (it has no Windows build)
+    uvicorn.run(
+        "main:app", host="127.0.0.1", port=8000, reload=True,
+        loop="auto", http="httptools", timeout_keep_alive=30,
+    )